@@ -0,0 +1,162 @@
+import numpy as np
+from typing import Dict, Optional
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Below this many cells the JIT dispatch overhead outweighs the fused loop.
+KERNEL_MIN_SIZE = 100_000
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _count_outliers_jit(a, lo, hi):
+        n, m = a.shape
+        out = np.zeros(m, np.int64)
+        for j in prange(m):
+            c = 0
+            loj = lo[j]
+            hij = hi[j]
+            for i in range(n):
+                v = a[i, j]
+                if v < loj or v > hij:
+                    c += 1
+            out[j] = c
+        return out
+
+    @njit(parallel=True, cache=True)
+    def _nan_scan_jit(v, flags):
+        c = 0
+        for i in prange(v.shape[0]):
+            if np.isnan(v[i]):
+                flags[i] = True
+                c += 1
+        return c
+
+    @njit(cache=True)
+    def _select(s, lo, hi, k):
+        # In-place quickselect (Wirth) on s[lo:hi + 1] with a median-of-three
+        # pivot: afterwards s[k] is in sorted position, smaller values to its
+        # left and larger ones to its right.
+        while lo < hi:
+            x, y, z = s[lo], s[k], s[hi]
+            pivot = max(min(x, y), min(max(x, y), z))
+            i = lo
+            j = hi
+            while i <= j:
+                while s[i] < pivot:
+                    i += 1
+                while pivot < s[j]:
+                    j -= 1
+                if i <= j:
+                    s[i], s[j] = s[j], s[i]
+                    i += 1
+                    j -= 1
+            if j < k:
+                lo = i
+            if k < i:
+                hi = j
+
+    @njit(cache=True)
+    def _quantile_at(s, lo, hi, p):
+        # Linear-interpolated quantile (np.quantile's default) of the whole
+        # array, selecting only within s[lo:hi + 1], which must already hold
+        # every value of the target rank and the one after it.
+        pos = p * (s.shape[0] - 1)
+        k = int(np.floor(pos))
+        _select(s, lo, hi, k)
+        v = s[k]
+        if k + 1 >= s.shape[0] or pos == k:
+            return v
+        # The next order statistic is the minimum of what lies to the right.
+        nxt = s[k + 1]
+        for i in range(k + 2, hi + 1):
+            nxt = min(nxt, s[i])
+        return v + (nxt - v) * (pos - k)
+
+    @njit(parallel=True, cache=True)
+    def _column_summary_jit(b):
+        # b is the transposed block: one contiguous row per column.
+        m, n = b.shape
+        mean = np.empty(m)
+        std = np.empty(m)
+        vmin = np.empty(m)
+        vmax = np.empty(m)
+        q1 = np.empty(m)
+        median = np.empty(m)
+        q3 = np.empty(m)
+        outliers = np.zeros(m, np.int64)
+        k2 = int(np.floor(0.5 * (n - 1)))
+        for j in prange(m):
+            col = b[j]
+            # Shifted sums for mean/variance (shifting by the first value
+            # keeps the one-pass formula stable) alongside min/max.
+            shift = np.float64(col[0])
+            total = 0.0
+            total_sq = 0.0
+            lo_v = np.inf
+            hi_v = -np.inf
+            for i in range(n):
+                v = np.float64(col[i])
+                d = v - shift
+                total += d
+                total_sq += d * d
+                lo_v = min(lo_v, v)
+                hi_v = max(hi_v, v)
+            mean[j] = shift + total / n
+            std[j] = np.sqrt(max(total_sq - total * total / n, 0.0) / (n - 1)) if n > 1 else np.nan
+            vmin[j] = lo_v
+            vmax[j] = hi_v
+
+            # Quartiles by quickselect on a local copy (O(n), not a full
+            # sort): the median first, then Q1/Q3 within its two halves;
+            # a linear compare then counts the IQR outliers.
+            s = col.astype(np.float64)
+            median[j] = _quantile_at(s, 0, n - 1, 0.5)
+            q1[j] = _quantile_at(s, 0, k2, 0.25)
+            q3[j] = _quantile_at(s, k2, n - 1, 0.75)
+            iqr = q3[j] - q1[j]
+            lower = q1[j] - 1.5 * iqr
+            upper = q3[j] + 1.5 * iqr
+            c = 0
+            for i in range(n):
+                v = col[i]
+                if v < lower or v > upper:
+                    c += 1
+            outliers[j] = c
+        return mean, std, vmin, vmax, q1, median, q3, outliers
+
+
+def count_outliers(a: np.ndarray, lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+    """Per-column count of values outside [lo, hi] for a 2-D float block."""
+    if NUMBA_AVAILABLE and a.size >= KERNEL_MIN_SIZE:
+        return _count_outliers_jit(np.ascontiguousarray(a), lo, hi)
+    return ((a < lo) | (a > hi)).sum(axis=0)
+
+
+def nan_scan(values: np.ndarray, row_flags: np.ndarray) -> int:
+    """NaN count of a 1-D float column; also sets row_flags where it is NaN."""
+    if NUMBA_AVAILABLE and values.size >= KERNEL_MIN_SIZE:
+        return _nan_scan_jit(values, row_flags)
+    mask = np.isnan(values)
+    row_flags |= mask
+    return int(mask.sum())
+
+
+def column_summary(a: np.ndarray) -> Optional[Dict[str, np.ndarray]]:
+    """Fused per-column mean/std/min/max/quartiles/outlier count for a 2-D
+    float block, or None when the JIT kernel is unavailable or not worth it."""
+    if not NUMBA_AVAILABLE or a.size < KERNEL_MIN_SIZE or a.shape[0] == 0:
+        return None
+    # The numeric block from pandas is F-ordered, so its transpose is usually
+    # already C-contiguous and each column is scanned from contiguous memory.
+    mean, std, vmin, vmax, q1, median, q3, outliers = _column_summary_jit(
+        np.ascontiguousarray(a.T)
+    )
+    return {
+        "mean": mean, "median": median, "std": std, "min": vmin, "max": vmax,
+        "25%": q1, "75%": q3, "outliers": outliers
+    }
@@ -1,72 +1,197 @@
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
+
+from agents._kernels import column_summary, count_outliers
+
+# Row order of the aggregate frame shared by the analyst and the cleaner.
+AGGREGATE_STATS = ['mean', 'median', 'std', 'min', 'max']
+
+# Largest rounding error a downcast may introduce: half of the report's
+# last printed decimal (values are written with :.2f).
+REPORT_TOLERANCE = 0.005
 
 
 class AnalystAgent:    
     def __init__(self):
         self.name = "DataAnalyst"
     
-    def compute_statistics(self, df: pd.DataFrame) -> Dict[str, Any]:
-        numeric_cols = df.select_dtypes(include=['number']).columns
+    def numeric_block(self, df: pd.DataFrame,
+                      downcast: bool = False) -> Tuple[List[str], np.ndarray]:
+        # Computed once per frame by the caller and threaded into the stat
+        # methods so they skip repeated dtype introspection.
+        numeric_df = df.select_dtypes(include=['number'])
+        numeric_cols = list(numeric_df.columns)
+        numeric_arr = numeric_df.to_numpy(dtype=np.float64, na_value=np.nan)
         
-        stats = {
-            "summary": df.describe().to_dict(),
-            "correlations": df[numeric_cols].corr().to_dict() if len(numeric_cols) > 1 else {},
-            "numeric_columns_stats": {}
-        }
+        # float32 halves the bytes the reductions stream through, but it only
+        # carries ~7 significant digits: integers past 2**24 (IDs, counts)
+        # and floats past ~2**17 would print wrong at the report's 2 decimals.
+        # Only used if every value fits, integer columns round-trip exactly
+        # and float columns stay within report precision.
+        if (downcast and numeric_arr.size
+                and np.nanmax(np.abs(numeric_arr)) <= np.finfo(np.float32).max):
+            arr32 = numeric_arr.astype(np.float32)
+            tolerances = [REPORT_TOLERANCE if dtype.kind == 'f' else 0.0
+                          for dtype in numeric_df.dtypes]
+            # NaN - NaN stays NaN and fails the comparison, so gaps pass.
+            if all(not (np.abs(arr32[:, i] - numeric_arr[:, i]) > tol).any()
+                   for i, tol in enumerate(tolerances)):
+                numeric_arr = arr32
+        return numeric_cols, numeric_arr
+    
+    def correlation_matrix(self, df: pd.DataFrame,
+                           numeric_cols: Optional[List[str]] = None,
+                           numeric_arr: Optional[np.ndarray] = None) -> Optional[pd.DataFrame]:
+        if numeric_cols is None or numeric_arr is None:
+            numeric_cols, numeric_arr = self.numeric_block(df)
+        
+        if len(numeric_cols) < 2:
+            return None
+        
+        # Cleaned blocks have no NaNs, so one BLAS-backed corrcoef matches
+        # pandas' pairwise corr(); fall back to pandas when NaNs remain.
+        if np.isnan(numeric_arr).any():
+            return df[numeric_cols].corr()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            corr = np.corrcoef(numeric_arr, rowvar=False)
+        return pd.DataFrame(corr, index=numeric_cols, columns=numeric_cols)
+    
+    def column_summary(self, numeric_cols: List[str],
+                       numeric_arr: np.ndarray) -> Optional[pd.DataFrame]:
+        # Single fused kernel pass producing the aggregate rows plus count,
+        # quartiles and outlier counts, which compute_statistics and
+        # detect_outliers pick up when present. None means "use the
+        # per-method paths" (no numba, small block, or NaNs present).
+        summary = column_summary(numeric_arr)
+        if summary is None or np.isnan(summary["mean"]).any():
+            return None
+        summary_df = pd.DataFrame(summary, index=numeric_cols, dtype=float).T
+        summary_df.loc['count'] = float(numeric_arr.shape[0])
+        return summary_df
+    
+    def numeric_aggregates(self, df: pd.DataFrame, numeric_cols: List[str],
+                            aggregates: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        # Callers compute these once and pass them to compute_statistics,
+        # generate_insights and detect_outliers; aggregates precomputed
+        # upstream (e.g. by the cleaner) are used as-is.
+        if aggregates is not None:
+            return aggregates
+        if not numeric_cols:
+            # agg() has nothing to concatenate without columns.
+            return pd.DataFrame(index=AGGREGATE_STATS, dtype=float)
+        return df[numeric_cols].agg(AGGREGATE_STATS)
+    
+    def compute_statistics(self, df: pd.DataFrame,
+                           numeric_cols: Optional[List[str]] = None,
+                           aggregates: Optional[pd.DataFrame] = None,
+                           corr_matrix: Optional[pd.DataFrame] = None) -> Dict[str, Any]:
+        if numeric_cols is None:
+            numeric_cols = list(df.select_dtypes(include=['number']).columns)
+        if corr_matrix is None:
+            corr_matrix = self.correlation_matrix(df)
+        numeric_df = df[numeric_cols]
+        
+        # One aggregation pass for the per-column stats; quartiles are batched
+        # separately and merged to rebuild the describe()-style summary.
+        agg_df = self.numeric_aggregates(df, numeric_cols, aggregates)
+        if {'25%', '75%'}.issubset(agg_df.index):
+            quartiles = agg_df.loc[['25%', 'median', '75%']].set_axis([0.25, 0.5, 0.75])
+        else:
+            quartiles = numeric_df.quantile([0.25, 0.5, 0.75])
+        counts = agg_df.loc['count'] if 'count' in agg_df.index else numeric_df.count()
         
+        summary = {}
         for col in numeric_cols:
-            stats["numeric_columns_stats"][col] = {
-                "mean": float(df[col].mean()),
-                "median": float(df[col].median()),
-                "std": float(df[col].std()),
-                "min": float(df[col].min()),
-                "max": float(df[col].max())
+            summary[col] = {
+                "count": float(counts[col]),
+                "mean": float(agg_df.at['mean', col]),
+                "std": float(agg_df.at['std', col]),
+                "min": float(agg_df.at['min', col]),
+                "25%": float(quartiles.at[0.25, col]),
+                "50%": float(quartiles.at[0.5, col]),
+                "75%": float(quartiles.at[0.75, col]),
+                "max": float(agg_df.at['max', col])
+            }
+        
+        stats = {
+            "summary": summary,
+            "correlations": corr_matrix.to_dict() if corr_matrix is not None else {},
+            "numeric_columns_stats": {
+                col: {k: float(agg_df.at[k, col]) for k in AGGREGATE_STATS}
+                for col in numeric_cols
             }
+        }
         
         return stats
     
-    def generate_insights(self, df: pd.DataFrame) -> List[str]:
+    def generate_insights(self, df: pd.DataFrame,
+                          numeric_cols: Optional[List[str]] = None,
+                          aggregates: Optional[pd.DataFrame] = None) -> List[str]:
         insights = []
-        numeric_cols = df.select_dtypes(include=['number']).columns
+        if numeric_cols is None:
+            numeric_cols = list(df.select_dtypes(include=['number']).columns)
         
         insights.append(f"Dataset contains {len(df)} records with {len(df.columns)} features")
         
         if len(numeric_cols) > 0:
-            for col in numeric_cols:
-                mean_val = df[col].mean()
-                median_val = df[col].median()
-                if mean_val > median_val * 1.2:
+            agg_df = self.numeric_aggregates(df, numeric_cols, aggregates)
+            mean = agg_df.loc['mean'].to_numpy()
+            median = agg_df.loc['median'].to_numpy()
+            right = mean > median * 1.2
+            left = mean < median * 0.8
+            for col, is_right, is_left in zip(numeric_cols, right, left):
+                if is_right:
                     insights.append(f"'{col}' shows right-skewed distribution (mean > median)")
-                elif mean_val < median_val * 0.8:
+                elif is_left:
                     insights.append(f"'{col}' shows left-skewed distribution (mean < median)")
         
-        cat_cols = df.select_dtypes(include=['object']).columns
+        cat_cols = df.select_dtypes(include=['object', 'category']).columns
         if len(cat_cols) > 0:
             for col in cat_cols:
-                unique_count = df[col].nunique()
+                if isinstance(df[col].dtype, pd.CategoricalDtype):
+                    unique_count = df[col].cat.categories.size
+                else:
+                    unique_count = df[col].nunique()
                 if unique_count < 10:
                     insights.append(f"'{col}' has {unique_count} unique categories")
         
         return insights
     
-    def detect_outliers(self, df: pd.DataFrame) -> Dict[str, Any]:
-        numeric_cols = df.select_dtypes(include=['number']).columns
+    def detect_outliers(self, df: pd.DataFrame,
+                        numeric_cols: Optional[List[str]] = None,
+                        numeric_arr: Optional[np.ndarray] = None,
+                        aggregates: Optional[pd.DataFrame] = None) -> Dict[str, Any]:
+        if numeric_cols is None or numeric_arr is None:
+            numeric_cols, numeric_arr = self.numeric_block(df)
         outliers = {}
         
-        for col in numeric_cols:
-            Q1 = df[col].quantile(0.25)
-            Q3 = df[col].quantile(0.75)
-            IQR = Q3 - Q1
-            lower_bound = Q1 - 1.5 * IQR
-            upper_bound = Q3 + 1.5 * IQR
-            
-            outlier_count = ((df[col] < lower_bound) | (df[col] > upper_bound)).sum()
+        if len(numeric_cols) == 0 or len(df) == 0:
+            return outliers
+        
+        if aggregates is not None and {'25%', '75%', 'outliers'}.issubset(aggregates.index):
+            # Quartiles and counts already came out of the fused summary pass.
+            q1 = aggregates.loc['25%', numeric_cols].to_numpy()
+            q3 = aggregates.loc['75%', numeric_cols].to_numpy()
+            counts = aggregates.loc['outliers', numeric_cols].to_numpy()
+        else:
+            # Batched IQR bounds over the whole numeric block, then a fused
+            # compare/reduce per column (JIT-compiled for large blocks).
+            # NaN-aware so an uncleaned column with gaps still gets bounds.
+            q1, q3 = np.nanquantile(numeric_arr, [0.25, 0.75], axis=0)
+            counts = None
+        iqr = q3 - q1
+        lower = q1 - 1.5 * iqr
+        upper = q3 + 1.5 * iqr
+        
+        if counts is None:
+            counts = count_outliers(numeric_arr, lower, upper)
+        
+        for col, outlier_count, lower_bound, upper_bound in zip(numeric_cols, counts, lower, upper):
             outliers[col] = {
                 "count": int(outlier_count),
                 "percentage": float(outlier_count / len(df) * 100),
                 "bounds": {"lower": float(lower_bound), "upper": float(upper_bound)}
             }
         
-        return outliers
\ No newline at end of file
+        return outliers
@@ -1,44 +1,206 @@
 import pandas as pd
-from typing import Dict, Any
+import numpy as np
+from typing import Dict, Any, List, Optional, Tuple
+
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
+
+from agents._kernels import nan_scan
+from agents.analyst import AGGREGATE_STATS
+
+# Polars only pays off once the frame is large enough to amortize conversion.
+POLARS_MIN_ROWS = 50_000
 
 
 class CleanerAgent:    
     def __init__(self):
         self.name = "DataCleaner"
     
-    def clean_data(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def clean_data(self, df: pd.DataFrame,
+                   str_cols: Optional[List[str]] = None) -> Dict[str, Any]:
         original_rows = len(df)
         
-        df = df.drop_duplicates()
+        if str_cols is None:
+            str_cols = list(df.select_dtypes(include=['object']).columns)
         
-        df = df.dropna()
-        
-        str_cols = df.select_dtypes(include=['object']).columns
-        for col in str_cols:
-            df[col] = df[col].str.strip()
+        aggregates = None
+        polars_result = None
+        if POLARS_AVAILABLE and original_rows > POLARS_MIN_ROWS:
+            polars_result = self._clean_polars(df, str_cols)
+        if polars_result is not None:
+            df, aggregates, duplicate_rows, n_null_rows, missing_values = polars_result
+            df = self._replace_columns(
+                df, {col: self._maybe_categorical(df[col]) for col in str_cols}
+            )
+        else:
+            # Duplicate and null masks are built once each, reused for the
+            # counts, and combined so the frame is sliced a single time.
+            dup_mask = df.duplicated().to_numpy()
+            missing_values, row_has_null = self._null_scan(df)
+            duplicate_rows = int(dup_mask.sum())
+            n_null_rows = int((row_has_null & ~dup_mask).sum())
+            df = df.loc[~(dup_mask | row_has_null)]
+            
+            # Object columns holding dates, bytes or mixed values have no
+            # .str accessor; only all-string columns are stripped.
+            df = self._replace_columns(df, {
+                col: self._maybe_categorical(
+                    df[col].str.strip()
+                    if pd.api.types.infer_dtype(df[col]) == 'string' else df[col]
+                )
+                for col in str_cols
+            })
         
         cleaned_rows = len(df)
         rows_removed = original_rows - cleaned_rows
         
         return {
             "cleaned_data": df,
+            "aggregates": aggregates,
             "metadata": {
                 "original_rows": original_rows,
                 "cleaned_rows": cleaned_rows,
                 "rows_removed": rows_removed,
+                "duplicate_rows": duplicate_rows,
+                "null_rows": n_null_rows,
+                "missing_values": missing_values,
                 "columns": list(df.columns),
                 "dtypes": df.dtypes.to_dict()
             }
         }
     
-    def validate_data(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _replace_columns(self, df: pd.DataFrame, columns: Dict[str, pd.Series]) -> pd.DataFrame:
+        # Rebuild the replaced columns as one frame and concat once; assigning
+        # them back in place splits the object block in the BlockManager,
+        # slowing later select_dtypes/to_numpy calls.
+        if not columns:
+            return df
+        replaced = pd.DataFrame(columns, index=df.index)
+        return pd.concat([df.drop(columns=list(columns)), replaced], axis=1)[list(df.columns)]
+    
+    def _maybe_categorical(self, s: pd.Series) -> pd.Series:
+        # Low-cardinality strings become categoricals so later nunique calls
+        # read the categories instead of rehashing every value. factorize
+        # hashes the column once for both the cardinality check and the codes.
+        # Sorted categories match what astype('category') would give, so
+        # value_counts ties and category listings stay in a stable order;
+        # values with no common ordering keep first-seen order.
+        try:
+            codes, uniques = pd.factorize(s, sort=True)
+        except TypeError:
+            codes, uniques = pd.factorize(s)
+        if len(uniques) < max(100, len(s) // 20):
+            return pd.Series(pd.Categorical.from_codes(codes, categories=uniques),
+                             index=s.index, name=s.name)
+        return s
+    
+    def _null_scan(self, df: pd.DataFrame) -> Tuple[Dict[str, int], np.ndarray]:
+        # Float columns are scanned one at a time straight from their own
+        # buffer (JIT kernel for long columns), with no N x M mask or float64
+        # copy of the block; numpy int/bool columns cannot hold nulls;
+        # anything else falls back to pandas isnull().
+        float_cols, other_cols = [], []
+        for col, dtype in df.dtypes.items():
+            if isinstance(dtype, np.dtype) and dtype.kind == 'f':
+                float_cols.append(col)
+            elif not (isinstance(dtype, np.dtype) and dtype.kind in 'iub'):
+                other_cols.append(col)
+        
+        counts = dict.fromkeys(df.columns, 0)
+        row_has_null = np.zeros(len(df), dtype=bool)
+        
+        for col in float_cols:
+            counts[col] = nan_scan(df[col].to_numpy(), row_has_null)
+        if other_cols:
+            other_na = df[other_cols].isnull()
+            counts.update(other_na.sum().items())
+            row_has_null |= other_na.any(axis=1).to_numpy()
+        
+        return {col: int(n) for col, n in counts.items()}, row_has_null
+    
+    def _clean_polars(self, df: pd.DataFrame, str_cols: List[str]
+                      ) -> Optional[Tuple[pd.DataFrame, Optional[pd.DataFrame], int, int, Dict[str, int]]]:
+        # The dedup is materialized once; one lazy query over it then does
+        # the null-drop/strip plus the numeric aggregates and null counts, so
+        # collect_all only shares the cheap subplans. Row order and index
+        # labels are kept so the result matches the pandas path.
+        # Returns None when the frame has no Polars equivalent.
+        numeric_cols = list(df.select_dtypes(include=['number']).columns)
+        try:
+            raw = pl.from_pandas(df)
+        except (TypeError, ValueError):
+            # Object columns mixing types (e.g. ints and strings) don't map
+            # to a single Arrow type; the caller cleans those with pandas.
+            return None
+        
+        # Only columns that converted to strings can be stripped; object
+        # columns of dates, bytes or decimals arrive as other Polars types.
+        strip_cols = [col for col in str_cols if raw.schema[col] == pl.String]
+        
+        # Original row positions ride along so the cleaned frame keeps the
+        # input's index labels; first occurrences are kept, like duplicated().
+        row_col = "__row__"
+        while row_col in raw.schema:
+            row_col += "_"
+        dedup = raw.with_row_index(row_col).unique(
+            subset=raw.columns, keep='first', maintain_order=True
+        )
+        clean_lf = (
+            dedup.lazy()
+            .drop_nulls()
+            .with_columns(pl.col(strip_cols).str.strip_chars())
+        )
+        count_lfs = [raw.lazy().select(pl.all().null_count())]
+        stat_lfs = [
+            clean_lf.select(getattr(pl.col(numeric_cols), stat)())
+            for stat in AGGREGATE_STATS
+        ] if numeric_cols else []
+        
+        cleaned, null_count_df, *stat_frames = pl.collect_all(
+            [clean_lf, *count_lfs, *stat_lfs]
+        )
+        
+        duplicate_rows = len(df) - len(dedup)
+        n_null_rows = len(dedup) - len(cleaned)
+        missing_values = {col: int(n) for col, n in null_count_df.row(0, named=True).items()}
+        
+        aggregates = None
+        if stat_frames:
+            aggregates = pd.DataFrame(
+                [frame.row(0) for frame in stat_frames],
+                index=AGGREGATE_STATS,
+                columns=numeric_cols,
+                dtype=float
+            )
+        cleaned_df = cleaned.drop(row_col).to_pandas()
+        cleaned_df.index = df.index[cleaned[row_col].to_numpy()]
+        return cleaned_df, aggregates, duplicate_rows, n_null_rows, missing_values
+    
+    def validate_data(self, df: pd.DataFrame,
+                      categorical_cols: Optional[List[str]] = None,
+                      known_clean: bool = False) -> Dict[str, Any]:
+        if categorical_cols is None:
+            categorical_cols = list(df.select_dtypes(include=['object', 'category']).columns)
+        
+        # Output of clean_data has no nulls or duplicate rows left; skip
+        # rehashing and rescanning every row to confirm it.
+        if known_clean:
+            missing_values = {col: 0 for col in df.columns}
+            duplicate_rows = 0
+        else:
+            missing_values = df.isnull().sum().to_dict()
+            duplicate_rows = df.duplicated().sum()
+        
         validation_report = {
             "total_rows": len(df),
             "total_columns": len(df.columns),
-            "missing_values": df.isnull().sum().to_dict(),
-            "duplicate_rows": df.duplicated().sum(),
+            "missing_values": missing_values,
+            "duplicate_rows": duplicate_rows,
             "numeric_columns": list(df.select_dtypes(include=['number']).columns),
-            "categorical_columns": list(df.select_dtypes(include=['object']).columns)
+            "categorical_columns": list(categorical_cols)
         }
         
         return validation_report
\ No newline at end of file
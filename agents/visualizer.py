@@ -1,67 +1,188 @@
 import pandas as pd
+import numpy as np
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import seaborn as sns
-from typing import Dict, Any
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+from typing import Dict, Any, Iterable, Optional
+import hashlib
+import io
 import os
+import re
+
+# Below this many columns the process pool startup costs more than it saves.
+PARALLEL_MIN_COLUMNS = 8
+
+HIST_BINS = 30
+
+# Content-keyed outputs kept per kind (each column's distribution plot, the
+# heatmap, the report); the same bound as run_pipeline's cache entries, so
+# outputs/ stops growing with every distinct dataset.
+MAX_OUTPUT_KEYS = 8
+
+_worker_figure = None
+
+
+def _new_distribution_figure():
+    return plt.subplots(1, 2, figsize=(12, 4), constrained_layout=True)
+
+
+def _render_distribution(fig, axes, col: str, values: np.ndarray, filepath: str) -> None:
+    axes[0].cla()
+    axes[1].cla()
+    
+    # Histogram
+    counts, edges = np.histogram(values, bins=HIST_BINS)
+    axes[0].bar(edges[:-1], counts, width=np.diff(edges), align='edge',
+                edgecolor='black', alpha=0.7)
+    axes[0].set_xlabel(col)
+    axes[0].set_ylabel('Frequency')
+    axes[0].set_title(f'Distribution of {col}')
+    
+    # Boxplot
+    axes[1].boxplot(values)
+    axes[1].set_ylabel(col)
+    axes[1].set_title(f'Boxplot of {col}')
+    
+    fig.savefig(filepath, dpi=100)
+
+
+def _plot_col(col: str, values: np.ndarray, filepath: str) -> str:
+    # Runs in a pool worker; each worker keeps one figure for all its columns.
+    global _worker_figure
+    if _worker_figure is None:
+        _worker_figure = _new_distribution_figure()
+    fig, axes = _worker_figure
+    _render_distribution(fig, axes, col, values, filepath)
+    return filepath
+
+
+_KEY_BYTES = 8
+
+
+def _content_key(*parts: bytes) -> str:
+    # Plot filenames embed a digest of their inputs, so an existing file
+    # already holds the rendering for that exact data and can be reused.
+    h = hashlib.blake2b(digest_size=_KEY_BYTES)
+    for part in parts:
+        h.update(part)
+    return h.hexdigest()
 
 
 class VisualizerAgent:    
     def __init__(self, output_dir: str = "outputs"):
         self.name = "DataVisualizer"
         self.output_dir = output_dir
-        os.makedirs(output_dir, exist_ok=True)
         sns.set_style("whitegrid")
     
+    def _output_path(self, filename: str) -> str:
+        # The agent outlives a single run (it is cached per process), so the
+        # directory is (re)created on every save rather than once at startup.
+        os.makedirs(self.output_dir, exist_ok=True)
+        return os.path.join(self.output_dir, filename)
+    
+    def _keep_recent(self, filepaths: Iterable[str]) -> None:
+        # The files just written or reused become the most recent of their
+        # kind; older keys beyond MAX_OUTPUT_KEYS are deleted.
+        filepaths = list(filepaths)
+        if not filepaths:
+            return
+        patterns = []
+        for filepath in filepaths:
+            os.utime(filepath)
+            stem, ext = os.path.splitext(os.path.basename(filepath))
+            prefix = stem[:-2 * _KEY_BYTES]
+            patterns.append(re.compile(
+                re.escape(prefix) + f'[0-9a-f]{{{2 * _KEY_BYTES}}}' + re.escape(ext) + '$'
+            ))
+        
+        with os.scandir(self.output_dir) as it:
+            entries = [entry for entry in it if entry.is_file()]
+        for pattern in patterns:
+            matches = sorted(
+                (entry for entry in entries if pattern.match(entry.name)),
+                key=lambda entry: entry.stat().st_mtime_ns, reverse=True
+            )
+            for entry in matches[MAX_OUTPUT_KEYS:]:
+                os.remove(entry.path)
+    
     def create_distribution_plots(self, df: pd.DataFrame) -> Dict[str, str]:
         numeric_cols = df.select_dtypes(include=['number']).columns
         saved_files = {}
-        
+        pending = {}
         for col in numeric_cols:
-            fig, axes = plt.subplots(1, 2, figsize=(12, 4))
-            
-            # Histogram
-            axes[0].hist(df[col], bins=30, edgecolor='black', alpha=0.7)
-            axes[0].set_xlabel(col)
-            axes[0].set_ylabel('Frequency')
-            axes[0].set_title(f'Distribution of {col}')
-            
-            # Boxplot
-            axes[1].boxplot(df[col])
-            axes[1].set_ylabel(col)
-            axes[1].set_title(f'Boxplot of {col}')
+            values = df[col].to_numpy(dtype=np.float64)
+            key = _content_key(values.tobytes(), str(HIST_BINS).encode())
+            filepath = self._output_path(f"distribution_{col}_{key}.png")
+            saved_files[col] = filepath
+            if not os.path.exists(filepath):
+                pending[col] = (values, filepath)
+        
+        cpus = os.cpu_count() or 1
+        if cpus > 1 and len(pending) >= PARALLEL_MIN_COLUMNS:
+            # Columns render independently, so fan them out across processes;
+            # a single-CPU pool would only add startup and pickling overhead.
+            # Workers come from a fork server: forking this process directly
+            # can deadlock once the analyst's parallel kernels have started
+            # their worker threads.
+            workers = min(cpus, len(pending))
+            with ProcessPoolExecutor(max_workers=workers, initializer=sns.set_style,
+                                     initargs=("whitegrid",),
+                                     mp_context=multiprocessing.get_context("forkserver")) as pool:
+                futures = [
+                    pool.submit(_plot_col, col, values, filepath)
+                    for col, (values, filepath) in pending.items()
+                ]
+                for future in futures:
+                    future.result()
+        elif pending:
+            # One figure reused for every column; axes are cleared per column
+            # instead of building and tearing down a Figure each time.
+            fig, axes = _new_distribution_figure()
             
-            plt.tight_layout()
-            filepath = os.path.join(self.output_dir, f"distribution_{col}.png")
-            plt.savefig(filepath, dpi=100, bbox_inches='tight')
-            plt.close()
+            for col, (values, filepath) in pending.items():
+                _render_distribution(fig, axes, col, values, filepath)
             
-            saved_files[col] = filepath
+            plt.close(fig)
         
+        self._keep_recent(saved_files.values())
         return saved_files
     
-    def create_correlation_heatmap(self, df: pd.DataFrame) -> str:
-        numeric_cols = df.select_dtypes(include=['number']).columns
+    def create_correlation_heatmap(self, df: pd.DataFrame,
+                                   corr_matrix: Optional[pd.DataFrame] = None) -> str:
+        if corr_matrix is None:
+            numeric_cols = df.select_dtypes(include=['number']).columns
+            
+            if len(numeric_cols) < 2:
+                return None
+            
+            corr_matrix = df[numeric_cols].corr()
         
-        if len(numeric_cols) < 2:
-            return None
+        key = _content_key(corr_matrix.to_numpy(dtype=np.float64).tobytes(),
+                           repr(list(corr_matrix.columns)).encode())
+        filepath = self._output_path(f"correlation_heatmap_{key}.png")
+        if os.path.exists(filepath):
+            self._keep_recent([filepath])
+            return filepath
         
         plt.figure(figsize=(10, 8))
-        corr_matrix = df[numeric_cols].corr()
         sns.heatmap(corr_matrix, annot=True, fmt='.2f', cmap='coolwarm', 
                     center=0, square=True, linewidths=1)
         plt.title('Correlation Heatmap')
         plt.tight_layout()
         
-        filepath = os.path.join(self.output_dir, "correlation_heatmap.png")
         plt.savefig(filepath, dpi=100, bbox_inches='tight')
         plt.close()
         
+        self._keep_recent([filepath])
         return filepath
     
     def create_summary_report(self, stats: Dict[str, Any], insights: list) -> str:
-        report_path = os.path.join(self.output_dir, "analysis_report.txt")
-        
-        with open(report_path, 'w') as f:
+        # Built in memory first so the file can be named by its content, like
+        # the plots; a memoized run then never points at another run's report.
+        with io.StringIO() as f:
             f.write("=" * 60 + "\n")
             f.write("DATA ANALYSIS REPORT\n")
             f.write("=" * 60 + "\n\n")
@@ -80,5 +201,13 @@ class VisualizerAgent:
                     f.write(f"\n{col}:\n")
                     for stat_name, value in col_stats.items():
                         f.write(f"  {stat_name}: {value:.2f}\n")
+            report = f.getvalue()
+        
+        key = _content_key(report.encode())
+        report_path = self._output_path(f"analysis_report_{key}.txt")
+        if not os.path.exists(report_path):
+            with open(report_path, 'w') as f:
+                f.write(report)
         
+        self._keep_recent([report_path])
         return report_path
\ No newline at end of file
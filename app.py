@@ -1,38 +1,60 @@
 import streamlit as st
 import pandas as pd
 import os
-from io import StringIO
+import hashlib
+import importlib.util
+from io import StringIO, BytesIO
 from agents.cleaner import CleanerAgent
 from agents.analyst import AnalystAgent
 from agents.visualizer import VisualizerAgent
 from langgraph.graph import StateGraph, END
-from typing import TypedDict, Annotated
+from typing import TypedDict, Annotated, List, Optional
 import operator
 
 class AnalysisState(TypedDict):
     raw_data: pd.DataFrame
     cleaned_data: pd.DataFrame
     cleaning_metadata: dict
+    numeric_aggregates: pd.DataFrame
     validation_report: dict
     statistics: dict
     insights: list
     outliers: dict
+    correlation_matrix: pd.DataFrame
     visualizations: dict
     report_path: str
     messages: Annotated[list, operator.add]
 
 
+# Agents are stateless across runs, so build them once instead of per node call.
+# Streamlit re-executes this script on every rerun; cache_resource keeps the
+# same instances (and the visualizer's one-time setup) across reruns/sessions.
+@st.cache_resource
+def _get_agents():
+    return CleanerAgent(), AnalystAgent(), VisualizerAgent()
+
+
+_CLEANER, _ANALYST, _VISUALIZER = _get_agents()
+
+
 def load_data_node(state: AnalysisState) -> AnalysisState:
     state["messages"].append("✓ Data loaded successfully")
     return state
 
 
 def cleaning_node(state: AnalysisState) -> AnalysisState:
-    cleaner = CleanerAgent()
-    cleaning_result = cleaner.clean_data(state["raw_data"])
+    cleaner = _CLEANER
+    # Cleaning keeps the column set but turns low-cardinality strings into
+    # categoricals; the raw object/string columns are exactly the ones it
+    # strips and categorizes, so the same list describes them for validation.
+    str_cols = list(state["raw_data"].select_dtypes(include=['object']).columns)
+    cleaning_result = cleaner.clean_data(state["raw_data"], str_cols=str_cols)
     state["cleaned_data"] = cleaning_result["cleaned_data"]
     state["cleaning_metadata"] = cleaning_result["metadata"]
-    state["validation_report"] = cleaner.validate_data(state["cleaned_data"])
+    state["numeric_aggregates"] = cleaning_result["aggregates"]
+    state["validation_report"] = cleaner.validate_data(
+        state["cleaned_data"], categorical_cols=str_cols, known_clean=True
+    )
     state["messages"].append(
         f"✓ Data cleaned: {state['cleaning_metadata']['rows_removed']} rows removed"
     )
@@ -40,10 +62,32 @@ def cleaning_node(state: AnalysisState) -> AnalysisState:
 
 
 def analysis_node(state: AnalysisState) -> AnalysisState:
-    analyst = AnalystAgent()
-    state["statistics"] = analyst.compute_statistics(state["cleaned_data"])
-    state["insights"] = analyst.generate_insights(state["cleaned_data"])
-    state["outliers"] = analyst.detect_outliers(state["cleaned_data"])
+    analyst = _ANALYST
+    df = state["cleaned_data"]
+    numeric_cols, numeric_arr = analyst.numeric_block(df, downcast=True)
+    # Numeric reductions run on the (possibly float32) block, not the full frame.
+    numeric_df = pd.DataFrame(numeric_arr, index=df.index, columns=numeric_cols, copy=False)
+    # The fused kernel summary, when available, supersedes the aggregates
+    # precomputed during cleaning and also carries quartiles/outlier counts.
+    summary = analyst.column_summary(numeric_cols, numeric_arr)
+    aggregates = analyst.numeric_aggregates(
+        numeric_df, numeric_cols,
+        summary if summary is not None else state["numeric_aggregates"]
+    )
+    state["correlation_matrix"] = analyst.correlation_matrix(
+        numeric_df, numeric_cols=numeric_cols, numeric_arr=numeric_arr
+    )
+    state["statistics"] = analyst.compute_statistics(
+        numeric_df, numeric_cols=numeric_cols, aggregates=aggregates,
+        corr_matrix=state["correlation_matrix"]
+    )
+    state["insights"] = analyst.generate_insights(
+        df, numeric_cols=numeric_cols, aggregates=aggregates
+    )
+    state["outliers"] = analyst.detect_outliers(
+        numeric_df, numeric_cols=numeric_cols, numeric_arr=numeric_arr,
+        aggregates=aggregates
+    )
     state["messages"].append(
         f"✓ Analysis complete: {len(state['insights'])} insights generated"
     )
@@ -51,9 +95,13 @@ def analysis_node(state: AnalysisState) -> AnalysisState:
 
 
 def visualization_node(state: AnalysisState) -> AnalysisState:
-    visualizer = VisualizerAgent()
+    visualizer = _VISUALIZER
     dist_plots = visualizer.create_distribution_plots(state["cleaned_data"])
-    heatmap = visualizer.create_correlation_heatmap(state["cleaned_data"])
+    heatmap = None
+    if state["correlation_matrix"] is not None:
+        heatmap = visualizer.create_correlation_heatmap(
+            state["cleaned_data"], corr_matrix=state["correlation_matrix"]
+        )
     state["visualizations"] = {
         "distributions": dist_plots,
         "correlation_heatmap": heatmap
@@ -81,6 +129,85 @@ def create_workflow() -> StateGraph:
     return workflow.compile()
 
 
+@st.cache_resource
+def _get_app():
+    return create_workflow()
+
+
+def _read_csv(source, parse_dates: Optional[List[str]] = None) -> pd.DataFrame:
+    # pyarrow's multi-threaded parser when installed; numpy-backed dtypes are
+    # kept so the agents' select_dtypes checks behave as with the C parser.
+    if importlib.util.find_spec("pyarrow") is None:
+        return pd.read_csv(source, parse_dates=parse_dates)
+    
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.types as patypes
+    
+    if hasattr(source, "getvalue"):
+        data = source.getvalue()
+    else:
+        with open(source, 'rb') as f:
+            data = f.read()
+    
+    # pyarrow rejects some files the C parser accepts: duplicate header names
+    # (renamed to a.1 by the C parser) and short rows (padded with NaN).
+    # Those are read with the C parser instead.
+    try:
+        schema = pacsv.open_csv(BytesIO(data)).schema
+        if len(set(schema.names)) == len(schema.names):
+            # pyarrow infers ISO dates/timestamps on its own, which the
+            # cleaner would then try to strip as strings; keep them as text
+            # like the C parser does unless the caller asked to parse them.
+            as_text = {
+                field.name: str for field in schema
+                if patypes.is_temporal(field.type) and field.name not in (parse_dates or [])
+            }
+            return pd.read_csv(BytesIO(data), engine="pyarrow", dtype=as_text or None,
+                               parse_dates=parse_dates)
+    except (pa.ArrowInvalid, pd.errors.ParserError):
+        pass
+    return pd.read_csv(BytesIO(data), parse_dates=parse_dates)
+
+
+def _hash_df(df: pd.DataFrame) -> bytes:
+    # Content fingerprint; column names and dtypes are folded in because
+    # hash_pandas_object only covers the values.
+    h = hashlib.blake2b(digest_size=16)
+    h.update(repr(list(zip(df.columns, map(str, df.dtypes)))).encode())
+    h.update(pd.util.hash_pandas_object(df, index=False).values.tobytes())
+    return h.digest()
+
+
+# Each entry pickles the raw and cleaned frames, so keep only recent uploads.
+@st.cache_data(hash_funcs={pd.DataFrame: _hash_df}, max_entries=8)
+def run_pipeline(df: pd.DataFrame) -> dict:
+    initial_state = {
+        "raw_data": df,
+        "cleaned_data": None,
+        "cleaning_metadata": {},
+        "numeric_aggregates": None,
+        "validation_report": {},
+        "statistics": {},
+        "insights": [],
+        "outliers": {},
+        "correlation_matrix": None,
+        "visualizations": {},
+        "report_path": "",
+        "messages": []
+    }
+    return _get_app().invoke(initial_state)
+
+
+def _outputs_exist(state: dict) -> bool:
+    # Cache hits skip the visualizer, so a memoized run can outlive files the
+    # visualizer has since pruned from outputs/.
+    visualizations = state["visualizations"]
+    paths = [*visualizations.get("distributions", {}).values(),
+             visualizations.get("correlation_heatmap"), state["report_path"]]
+    return all(os.path.exists(path) for path in paths if path)
+
+
 st.set_page_config(
     page_title="Multi-Agent Data Analysis",
     page_icon="",
@@ -128,10 +255,10 @@ with tab1:
     if uploaded_file or use_sample:
         try:
             if use_sample:
-                df = pd.read_csv("sample_data.csv")
+                df = _read_csv("sample_data.csv")
                 st.success(" Sample data loaded!")
             else:
-                df = pd.read_csv(uploaded_file)
+                df = _read_csv(uploaded_file)
                 st.success(" File uploaded successfully!")
             
             st.subheader("Data Preview")
@@ -153,21 +280,10 @@ with tab2:
     if 'df' in st.session_state:
         if st.button("🚀 Run Analysis Pipeline", type="primary"):
             with st.spinner("Running multi-agent analysis..."):
-                initial_state = {
-                    "raw_data": st.session_state['df'],
-                    "cleaned_data": None,
-                    "cleaning_metadata": {},
-                    "validation_report": {},
-                    "statistics": {},
-                    "insights": [],
-                    "outliers": {},
-                    "visualizations": {},
-                    "report_path": "",
-                    "messages": []
-                }
-                
-                app = create_workflow()
-                final_state = app.invoke(initial_state)
+                final_state = run_pipeline(st.session_state['df'])
+                if not _outputs_exist(final_state):
+                    run_pipeline.clear(st.session_state['df'])
+                    final_state = run_pipeline(st.session_state['df'])
                 
                 st.session_state['results'] = final_state
             
@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+
+from agents.analyst import AnalystAgent
+
+
+def test_downcast_keeps_large_integers_exact():
+    df = pd.DataFrame({
+        "id": np.arange(123456790, 123456810),
+        "amount": np.linspace(0.0, 1.0, 20),
+    })
+
+    cols, arr = AnalystAgent().numeric_block(df, downcast=True)
+
+    assert arr.dtype == np.float64
+    assert arr[:, cols.index("id")].min() == 123456790
+
+
+def test_downcast_keeps_large_floats_at_report_precision():
+    cents = pd.DataFrame({"price": [1.25, 9.99, 3.5]})
+    revenue = pd.DataFrame({"revenue": [1234567.89, 250000.13, 745524.67]})
+
+    _, cents_arr = AnalystAgent().numeric_block(cents, downcast=True)
+    _, revenue_arr = AnalystAgent().numeric_block(revenue, downcast=True)
+
+    assert cents_arr.dtype == np.float32
+    assert revenue_arr.dtype == np.float64
+    assert f"{revenue_arr.max():.2f}" == "1234567.89"
+
+
+def test_detect_outliers_ignores_missing_values():
+    df = pd.DataFrame({"x": [1.0, 2.0, 3.0, 4.0, np.nan, 100.0]})
+
+    outliers = AnalystAgent().detect_outliers(df)
+
+    assert outliers["x"]["count"] == 1
+    assert not np.isnan(outliers["x"]["bounds"]["upper"])
+
+
+def test_compute_statistics_without_numeric_columns():
+    df = pd.DataFrame({"name": ["a", "b"], "city": ["x", "y"]})
+
+    stats = AnalystAgent().compute_statistics(df)
+
+    assert stats == {"summary": {}, "correlations": {}, "numeric_columns_stats": {}}
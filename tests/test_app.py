@@ -0,0 +1,88 @@
+import os
+import shutil
+
+from streamlit.testing.v1 import AppTest
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+
+
+def run_pipeline_on_csv(tmp_path, monkeypatch, csv_text: str) -> AppTest:
+    # The "sample data" checkbox reads sample_data.csv from the working
+    # directory through the same reader as uploads.
+    (tmp_path / "sample_data.csv").write_text(csv_text)
+    monkeypatch.chdir(tmp_path)
+    at = AppTest.from_file(APP_PATH, default_timeout=120).run()
+    at.checkbox[0].check().run()
+    at.button[0].click().run()
+    return at
+
+
+def test_pipeline_handles_date_column(tmp_path, monkeypatch):
+    at = run_pipeline_on_csv(tmp_path, monkeypatch, (
+        "order_date,amount,name\n"
+        "2024-01-15,10.5, a\n"
+        "2024-01-16,11.0,b \n"
+        "2024-01-17,9.0,c\n"
+    ))
+
+    assert not at.exception
+    results = at.session_state["results"]
+    assert results["cleaning_metadata"]["cleaned_rows"] == 3
+    assert list(results["cleaned_data"]["order_date"].astype(str)) == [
+        "2024-01-15", "2024-01-16", "2024-01-17"
+    ]
+    assert list(results["cleaned_data"]["name"].astype(str)) == ["a", "b", "c"]
+
+
+def test_pipeline_handles_frame_without_numeric_columns(tmp_path, monkeypatch):
+    at = run_pipeline_on_csv(tmp_path, monkeypatch, (
+        "name,city\n"
+        "a,x\n"
+        "b,y\n"
+    ))
+
+    assert not at.exception
+    results = at.session_state["results"]
+    assert results["statistics"]["numeric_columns_stats"] == {}
+    assert results["outliers"] == {}
+
+
+def test_pipeline_renames_duplicate_headers(tmp_path, monkeypatch):
+    at = run_pipeline_on_csv(tmp_path, monkeypatch, (
+        "a,a,b\n"
+        "1,2,3\n"
+        "4,5,6\n"
+    ))
+
+    assert not at.exception
+    assert list(at.session_state["results"]["cleaned_data"].columns) == ["a", "a.1", "b"]
+
+
+def test_pipeline_pads_short_rows(tmp_path, monkeypatch):
+    at = run_pipeline_on_csv(tmp_path, monkeypatch, (
+        "a,b,c\n"
+        "1,2,3\n"
+        "4,5\n"
+    ))
+
+    assert not at.exception
+    meta = at.session_state["results"]["cleaning_metadata"]
+    assert meta["original_rows"] == 2
+    assert meta["missing_values"]["c"] == 1
+
+
+def test_rerun_regenerates_pruned_outputs(tmp_path, monkeypatch):
+    at = run_pipeline_on_csv(tmp_path, monkeypatch, (
+        "price,qty\n"
+        "1.5,2\n"
+        "2.5,3\n"
+        "9.0,4\n"
+    ))
+    shutil.rmtree(tmp_path / "outputs")
+
+    at.button[0].click().run()
+
+    assert not at.exception
+    results = at.session_state["results"]
+    assert os.path.exists(results["report_path"])
+    assert all(os.path.exists(path) for path in results["visualizations"]["distributions"].values())
@@ -0,0 +1,63 @@
+import datetime
+
+import numpy as np
+import pandas as pd
+
+from agents.cleaner import POLARS_MIN_ROWS, CleanerAgent
+
+
+def test_clean_data_counts_duplicates_and_nulls():
+    df = pd.DataFrame({
+        "price": [1.0, 1.0, np.nan, 4.0, 5.0],
+        "qty": [1, 1, 2, 3, 4],
+        "name": [" a", " a", "b", None, "c "],
+    })
+
+    result = CleanerAgent().clean_data(df)
+    meta = result["metadata"]
+
+    assert meta["duplicate_rows"] == 1
+    assert meta["null_rows"] == 2
+    assert meta["missing_values"] == {"price": 1, "qty": 0, "name": 1}
+    assert list(result["cleaned_data"].index) == [0, 4]
+    assert list(result["cleaned_data"]["name"].astype(str)) == ["a", "c"]
+
+
+def test_clean_data_handles_non_string_object_columns_on_large_frames():
+    n = POLARS_MIN_ROWS + 1
+    df = pd.DataFrame({
+        "x": np.arange(n, dtype=float),
+        "name": [" a "] * n,
+        "day": pd.Series([datetime.date(2024, 1, 1)] * n, dtype=object),
+        "mixed": pd.Series([1, "a"] * (n // 2) + [1], dtype=object),
+    })
+
+    result = CleanerAgent().clean_data(df)
+
+    assert result["metadata"]["cleaned_rows"] == n
+    assert list(result["cleaned_data"]["name"].astype(str).unique()) == ["a"]
+
+
+def test_clean_data_sorts_categories():
+    df = pd.DataFrame({"name": ["c", "a", "b", "a"], "qty": [1, 2, 3, 4]})
+
+    cleaned = CleanerAgent().clean_data(df)["cleaned_data"]
+
+    assert list(cleaned["name"].cat.categories) == ["a", "b", "c"]
+    assert list(cleaned["name"].astype(str)) == ["c", "a", "b", "a"]
+
+
+def test_clean_data_keeps_row_labels_on_large_frames():
+    n = POLARS_MIN_ROWS + 1
+    base = pd.DataFrame({"x": np.arange(n, dtype=float), "name": ["a"] * n})
+    df = pd.concat([base.iloc[:2], base.iloc[:1], base.iloc[2:]], ignore_index=True)
+    df.loc[3, "x"] = np.nan
+    df.index = df.index + 100
+
+    pandas_result = CleanerAgent().clean_data(df.iloc[:10])
+    result = CleanerAgent().clean_data(df)
+
+    assert list(pandas_result["cleaned_data"].index) == [100, 101, 104, 105, 106, 107, 108, 109]
+    assert list(result["cleaned_data"].index[:4]) == [100, 101, 104, 105]
+    assert result["cleaned_data"].index[-1] == n + 100
+    assert list(result["cleaned_data"].columns) == ["x", "name"]
@@ -0,0 +1,87 @@
+import math
+import warnings
+
+import numpy as np
+import pytest
+
+pytest.importorskip("numba")
+
+from agents import _kernels
+from agents._kernels import KERNEL_MIN_SIZE, column_summary, count_outliers, nan_scan
+
+
+def block(n_rows: int, make) -> np.ndarray:
+    # At least KERNEL_MIN_SIZE cells so the JIT path is taken, built F-ordered
+    # like the numeric block pandas hands the analyst.
+    n_cols = math.ceil(KERNEL_MIN_SIZE / n_rows)
+    return np.asfortranarray(make((n_rows, n_cols)))
+
+
+rng = np.random.default_rng(0)
+
+CASES = {
+    "normal": block(1000, lambda shape: rng.normal(size=shape)),
+    "odd_rows": block(1001, lambda shape: rng.normal(size=shape)),
+    "heavy_tail": block(500, lambda shape: rng.lognormal(size=shape)),
+    "ties": block(400, lambda shape: rng.integers(0, 4, shape).astype(float)),
+    "sorted": block(1000, lambda shape: np.sort(rng.normal(size=shape), axis=0)),
+    "reverse_sorted": block(1000, lambda shape: np.sort(rng.normal(size=shape), axis=0)[::-1]),
+    "constant": block(1000, lambda shape: np.full(shape, 7.5)),
+    "one_row": block(1, lambda shape: rng.normal(size=shape)),
+    "two_rows": block(2, lambda shape: rng.normal(size=shape)),
+    "three_rows": block(3, lambda shape: rng.normal(size=shape)),
+    "float32": block(1000, lambda shape: rng.normal(size=shape).astype(np.float32)),
+}
+
+
+@pytest.mark.parametrize("name", list(CASES))
+def test_column_summary_matches_numpy(name):
+    a = CASES[name]
+
+    summary = column_summary(a)
+
+    expected = a.astype(np.float64)
+    q1, median, q3 = np.quantile(expected, [0.25, 0.5, 0.75], axis=0)
+    iqr = q3 - q1
+    outliers = ((expected < q1 - 1.5 * iqr) | (expected > q3 + 1.5 * iqr)).sum(axis=0)
+    with warnings.catch_warnings():
+        # One-row blocks have no sample std (NaN), which NumPy warns about.
+        warnings.simplefilter("ignore", RuntimeWarning)
+        std = expected.std(axis=0, ddof=1)
+
+    assert summary is not None
+    np.testing.assert_allclose(summary["25%"], q1, rtol=1e-12, atol=1e-12)
+    np.testing.assert_allclose(summary["median"], median, rtol=1e-12, atol=1e-12)
+    np.testing.assert_allclose(summary["75%"], q3, rtol=1e-12, atol=1e-12)
+    np.testing.assert_allclose(summary["mean"], expected.mean(axis=0), rtol=1e-9, atol=1e-12)
+    np.testing.assert_allclose(summary["std"], std, rtol=1e-9, atol=1e-12)
+    np.testing.assert_array_equal(summary["min"], expected.min(axis=0))
+    np.testing.assert_array_equal(summary["max"], expected.max(axis=0))
+    np.testing.assert_array_equal(summary["outliers"], outliers)
+
+
+def test_count_outliers_jit_matches_numpy_fallback(monkeypatch):
+    a = block(1000, lambda shape: rng.lognormal(size=shape))
+    lo, hi = np.quantile(a, [0.05, 0.95], axis=0)
+
+    jit_counts = count_outliers(a, lo, hi)
+    monkeypatch.setattr(_kernels, "NUMBA_AVAILABLE", False)
+    numpy_counts = count_outliers(a, lo, hi)
+
+    np.testing.assert_array_equal(jit_counts, numpy_counts)
+
+
+def test_nan_scan_jit_matches_numpy_fallback(monkeypatch):
+    values = rng.normal(size=KERNEL_MIN_SIZE)
+    values[rng.random(KERNEL_MIN_SIZE) < 0.1] = np.nan
+    # Flags already set by earlier columns must be kept, not overwritten.
+    seed_flags = rng.random(KERNEL_MIN_SIZE) < 0.05
+
+    jit_flags = seed_flags.copy()
+    jit_count = nan_scan(values, jit_flags)
+    monkeypatch.setattr(_kernels, "NUMBA_AVAILABLE", False)
+    numpy_flags = seed_flags.copy()
+    numpy_count = nan_scan(values, numpy_flags)
+
+    assert jit_count == numpy_count
+    np.testing.assert_array_equal(jit_flags, numpy_flags)
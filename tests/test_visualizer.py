@@ -0,0 +1,91 @@
+import os
+import shutil
+
+import pandas as pd
+
+from agents import visualizer as visualizer_module
+from agents.visualizer import MAX_OUTPUT_KEYS, PARALLEL_MIN_COLUMNS, VisualizerAgent
+
+
+def test_summary_report_is_named_by_content(tmp_path):
+    visualizer = VisualizerAgent(output_dir=str(tmp_path))
+    stats_a = {"numeric_columns_stats": {"price": {"mean": 1.0}}}
+    stats_b = {"numeric_columns_stats": {"price": {"mean": 2.0}}}
+
+    path_a = visualizer.create_summary_report(stats_a, ["insight A"])
+    path_b = visualizer.create_summary_report(stats_b, ["insight B"])
+
+    assert path_a != path_b
+    assert visualizer.create_summary_report(stats_a, ["insight A"]) == path_a
+    with open(path_a) as f:
+        report_a = f.read()
+    assert "insight A" in report_a and "mean: 1.00" in report_a
+
+
+def test_recreates_output_dir_removed_after_init(tmp_path):
+    output_dir = tmp_path / "outputs"
+    visualizer = VisualizerAgent(output_dir=str(output_dir))
+    visualizer.create_summary_report({}, ["earlier run"])
+    shutil.rmtree(output_dir)
+
+    plots = visualizer.create_distribution_plots(pd.DataFrame({"price": [1.0, 2.0, 3.0]}))
+    report = visualizer.create_summary_report({}, ["insight"])
+
+    assert os.path.exists(plots["price"]) and os.path.exists(report)
+
+
+def test_distribution_plots_skip_rendering_unchanged_data(tmp_path, monkeypatch):
+    visualizer = VisualizerAgent(output_dir=str(tmp_path))
+    df = pd.DataFrame({"price": [1.0, 2.0, 3.0], "qty": [4.0, 5.0, 6.0]})
+    rendered = []
+    render = visualizer_module._render_distribution
+    monkeypatch.setattr(visualizer_module, "_render_distribution",
+                        lambda *args: rendered.append(args[2]) or render(*args))
+
+    first = visualizer.create_distribution_plots(df)
+    second = visualizer.create_distribution_plots(df)
+
+    assert rendered == ["price", "qty"]
+    assert first == second
+
+
+def test_outputs_are_pruned_to_recent_keys(tmp_path):
+    visualizer = VisualizerAgent(output_dir=str(tmp_path))
+
+    for i in range(MAX_OUTPUT_KEYS + 3):
+        visualizer.create_distribution_plots(pd.DataFrame({"price": [float(i), 2.0]}))
+        visualizer.create_summary_report({}, [f"insight {i}"])
+    # Reusing an old key makes it recent again.
+    kept = visualizer.create_distribution_plots(pd.DataFrame({"price": [3.0, 2.0]}))["price"]
+
+    names = os.listdir(tmp_path)
+    assert len([n for n in names if n.startswith("distribution_price_")]) == MAX_OUTPUT_KEYS
+    assert len([n for n in names if n.startswith("analysis_report_")]) == MAX_OUTPUT_KEYS
+    assert os.path.exists(kept)
+
+
+def wide_frame() -> pd.DataFrame:
+    return pd.DataFrame({f"c{i}": [float(i), 2.0, 3.0] for i in range(PARALLEL_MIN_COLUMNS)})
+
+
+def test_distribution_plots_render_wide_frames_in_a_pool(tmp_path, monkeypatch):
+    monkeypatch.setattr(visualizer_module.os, "cpu_count", lambda: 2)
+    pools = []
+    pool_cls = visualizer_module.ProcessPoolExecutor
+    monkeypatch.setattr(visualizer_module, "ProcessPoolExecutor",
+                        lambda *args, **kwargs: pools.append(kwargs) or pool_cls(*args, **kwargs))
+
+    plots = VisualizerAgent(output_dir=str(tmp_path)).create_distribution_plots(wide_frame())
+
+    assert [pool["max_workers"] for pool in pools] == [2]
+    assert len(plots) == PARALLEL_MIN_COLUMNS
+    assert all(os.path.exists(path) for path in plots.values())
+
+
+def test_distribution_plots_skip_the_pool_on_one_cpu(tmp_path, monkeypatch):
+    monkeypatch.setattr(visualizer_module.os, "cpu_count", lambda: 1)
+    monkeypatch.setattr(visualizer_module, "ProcessPoolExecutor", None)
+
+    plots = VisualizerAgent(output_dir=str(tmp_path)).create_distribution_plots(wide_frame())
+
+    assert all(os.path.exists(path) for path in plots.values())